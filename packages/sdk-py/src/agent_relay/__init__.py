@@ -55,12 +55,19 @@ from .types import (
     StepForceReleasedEvent,
     WorkflowEvent,
     WorkflowEventCallback,
+    dispatch_event,
+    parse_event,
     RunOptions,
     TrajectoryConfig,
     WorkflowResult,
     WorkflowRunRow,
     WorkflowStepRow,
+    WorkflowStepTable,
     SwarmPattern,
+    SWARM_PATTERNS,
+    AGENT_CLIS,
+    WORKFLOW_RUN_STATUSES,
+    WORKFLOW_STEP_STATUSES,
     AgentDefinition,
     AgentConstraints,
     PathDefinition,
@@ -123,12 +130,19 @@ __all__ = [
     "StepForceReleasedEvent",
     "WorkflowEvent",
     "WorkflowEventCallback",
+    "dispatch_event",
+    "parse_event",
     "RunOptions",
     "TrajectoryConfig",
     "WorkflowResult",
     "WorkflowRunRow",
     "WorkflowStepRow",
+    "WorkflowStepTable",
     "SwarmPattern",
+    "SWARM_PATTERNS",
+    "AGENT_CLIS",
+    "WORKFLOW_RUN_STATUSES",
+    "WORKFLOW_STEP_STATUSES",
     "AgentDefinition",
     "AgentConstraints",
     "PathDefinition",
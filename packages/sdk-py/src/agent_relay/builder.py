@@ -18,19 +18,20 @@ Example::
 from __future__ import annotations
 
 import copy
+import heapq
 import os
 import re
 import shutil
 import subprocess
 import sys
 import tempfile
+from collections import defaultdict
 from pathlib import Path
-from typing import Any
-
-import yaml
+from typing import Any, Sequence
 
 from .types import (
     AgentCli,
+    AgentDefinition,
     AgentOptions,
     Barrier,
     ConsensusStrategy,
@@ -57,6 +58,7 @@ from .types import (
     VerificationCheck,
     WorkflowEvent,
     WorkflowEventCallback,
+    WorkflowStep,
     WorkflowRunStatus,
     WorkflowResult,
 )
@@ -70,6 +72,19 @@ _STEP_LINE_RE = re.compile(
 _VAR_RE = re.compile(r"{{\s*([^{}\s]+)\s*}}")
 _INT_RE = re.compile(r"\d+")
 
+# Prefer libyaml's C dumper when compiled in; same output, much faster.
+# Resolved on first use so `import agent_relay` never pays the PyYAML import.
+_YAML_DUMPER: Any = None
+
+
+def _ensure_yaml() -> None:
+    """Import PyYAML the first time the builder actually serializes."""
+    global yaml, _YAML_DUMPER
+    if _YAML_DUMPER is None:
+        import yaml
+
+        _YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
 
 class WorkflowBuilder:
     """Fluent builder that constructs Relay workflow config and runs it via agent-relay CLI."""
@@ -83,35 +98,49 @@ class WorkflowBuilder:
         self._channel: str | None = None
         self._idle_nudge: dict[str, Any] | None = None
         self._agents: list[dict[str, Any]] = []
+        self._agents_by_name: dict[str, dict[str, Any]] = {}
         self._steps: list[dict[str, Any]] = []
         self._error_handling: dict[str, Any] | None = None
         self._coordination: dict[str, Any] | None = None
         self._state: dict[str, Any] | None = None
         self._trajectories: dict[str, Any] | bool | None = None
+        self._topo_order: list[str] | None = None
+        self._config_cache: dict[str, Any] | None = None
+        self._yaml_cache: str | None = None
+
+    def _invalidate(self) -> None:
+        """Drop cached to_config/to_yaml output after a mutation."""
+        self._config_cache = None
+        self._yaml_cache = None
 
     def description(self, desc: str) -> WorkflowBuilder:
         """Set workflow description."""
         self._description = desc
+        self._invalidate()
         return self
 
     def pattern(self, p: SwarmPattern) -> WorkflowBuilder:
         """Set swarm pattern (default: "dag")."""
-        self._pattern = p
+        self._pattern = sys.intern(p)
+        self._invalidate()
         return self
 
     def max_concurrency(self, n: int) -> WorkflowBuilder:
         """Set maximum concurrent agents."""
         self._max_concurrency = n
+        self._invalidate()
         return self
 
     def timeout(self, ms: int) -> WorkflowBuilder:
         """Set global timeout in milliseconds."""
         self._timeout_ms = ms
+        self._invalidate()
         return self
 
     def channel(self, ch: str) -> WorkflowBuilder:
         """Set the relay channel for agent communication."""
         self._channel = ch
+        self._invalidate()
         return self
 
     def idle_nudge(
@@ -127,6 +156,7 @@ class WorkflowBuilder:
             escalate_after_ms=escalate_after_ms,
             max_nudges=max_nudges,
         ).to_dict()
+        self._invalidate()
         return self
 
     def coordination(
@@ -148,6 +178,7 @@ class WorkflowBuilder:
         if consensus_strategy is not None:
             config["consensusStrategy"] = consensus_strategy
         self._coordination = config
+        self._invalidate()
         return self
 
     def state(
@@ -164,6 +195,7 @@ class WorkflowBuilder:
         if namespace is not None:
             config["namespace"] = namespace
         self._state = config
+        self._invalidate()
         return self
 
     def trajectories(
@@ -183,6 +215,7 @@ class WorkflowBuilder:
             reflect_on_converge=reflect_on_converge,
             auto_decisions=auto_decisions,
         )
+        self._invalidate()
         return self
 
     def agent(
@@ -213,7 +246,12 @@ class WorkflowBuilder:
             idle_threshold_secs=idle_threshold_secs,
             interactive=interactive,
         )
-        agent_def: dict[str, Any] = {"name": name, "cli": opts.cli}
+        # Agent names and CLI ids recur across steps and lookups; interning
+        # lets those comparisons hit the pointer-equality fast path.
+        agent_def: dict[str, Any] = {
+            "name": sys.intern(name),
+            "cli": sys.intern(opts.cli),
+        }
 
         if opts.role is not None:
             agent_def["role"] = opts.role
@@ -239,8 +277,22 @@ class WorkflowBuilder:
             agent_def["constraints"] = constraints
 
         self._agents.append(agent_def)
+        self._agents_by_name[name] = agent_def
+        self._invalidate()
         return self
 
+    def bulk_agents(self, agents: Sequence[AgentDefinition]) -> WorkflowBuilder:
+        """Append pre-built agent definitions in one pass."""
+        agent_defs = [agent.to_dict() for agent in agents]
+        self._agents.extend(agent_defs)
+        self._agents_by_name.update((a["name"], a) for a in agent_defs)
+        self._invalidate()
+        return self
+
+    def get_agent(self, name: str) -> dict[str, Any] | None:
+        """Look up an added agent definition by name in O(1)."""
+        return self._agents_by_name.get(name)
+
     def step(
         self,
         name: str,
@@ -270,48 +322,73 @@ class WorkflowBuilder:
                 raise ValueError("deterministic steps must have a command")
             if agent is not None or task is not None:
                 raise ValueError("deterministic steps must not have agent or task")
-            step_def: dict[str, Any] = {"name": name, "type": "deterministic", "command": command}
-            if capture_output is not None:
-                step_def["captureOutput"] = capture_output
-            if fail_on_error is not None:
-                step_def["failOnError"] = fail_on_error
-            if depends_on is not None:
-                step_def["dependsOn"] = depends_on
-            if verification is not None:
-                step_def["verification"] = verification.to_dict()
-            if timeout_ms is not None:
-                step_def["timeoutMs"] = timeout_ms
+            # Single comprehension pass: one dict allocation, no post-build
+            # mutation or resize.
+            step_def: dict[str, Any] = {
+                key: value
+                for key, value in (
+                    ("name", sys.intern(name)),
+                    ("type", "deterministic"),
+                    ("command", command),
+                    ("captureOutput", capture_output),
+                    ("failOnError", fail_on_error),
+                    ("dependsOn", depends_on),
+                    (
+                        "verification",
+                        verification.to_dict() if verification is not None else None,
+                    ),
+                    ("timeoutMs", timeout_ms),
+                )
+                if value is not None
+            }
         elif type == "worktree":
             if agent is not None or task is not None:
                 raise ValueError("worktree steps must not have agent or task")
             if not branch:
                 raise ValueError("worktree steps must have a branch")
-            step_def = {"name": name, "type": "worktree", "branch": branch}
-            if base_branch is not None:
-                step_def["baseBranch"] = base_branch
-            if path is not None:
-                step_def["path"] = path
-            if create_branch is not None:
-                step_def["createBranch"] = create_branch
-            if depends_on is not None:
-                step_def["dependsOn"] = depends_on
-            if timeout_ms is not None:
-                step_def["timeoutMs"] = timeout_ms
+            step_def = {
+                key: value
+                for key, value in (
+                    ("name", sys.intern(name)),
+                    ("type", "worktree"),
+                    ("branch", branch),
+                    ("baseBranch", base_branch),
+                    ("path", path),
+                    ("createBranch", create_branch),
+                    ("dependsOn", depends_on),
+                    ("timeoutMs", timeout_ms),
+                )
+                if value is not None
+            }
         else:
             # Agent step
             if not agent or not task:
                 raise ValueError("Agent steps must have both agent and task")
-            step_def = {"name": name, "agent": agent, "task": task}
-            if depends_on is not None:
-                step_def["dependsOn"] = depends_on
-            if verification is not None:
-                step_def["verification"] = verification.to_dict()
-            if timeout_ms is not None:
-                step_def["timeoutMs"] = timeout_ms
-            if retries is not None:
-                step_def["retries"] = retries
+            step_def = {
+                key: value
+                for key, value in (
+                    ("name", sys.intern(name)),
+                    ("agent", sys.intern(agent)),
+                    ("task", task),
+                    ("dependsOn", depends_on),
+                    (
+                        "verification",
+                        verification.to_dict() if verification is not None else None,
+                    ),
+                    ("timeoutMs", timeout_ms),
+                    ("retries", retries),
+                )
+                if value is not None
+            }
 
         self._steps.append(step_def)
+        self._invalidate()
+        return self
+
+    def bulk_steps(self, steps: Sequence[WorkflowStep]) -> WorkflowBuilder:
+        """Append pre-built agent steps in one pass."""
+        self._steps.extend(step.to_dict() for step in steps)
+        self._invalidate()
         return self
 
     def on_error(
@@ -335,10 +412,14 @@ class WorkflowBuilder:
             self._error_handling["retryDelayMs"] = opts.retry_delay_ms
         if opts.notify_channel is not None:
             self._error_handling["notifyChannel"] = opts.notify_channel
+        self._invalidate()
         return self
 
     def to_config(self) -> dict[str, Any]:
         """Build and return the config as a dictionary (RelayYamlConfig shape)."""
+        if self._config_cache is not None:
+            return copy.deepcopy(self._config_cache)
+
         if not self._steps:
             raise ValueError("Workflow must have at least one step")
 
@@ -348,6 +429,25 @@ class WorkflowBuilder:
         if has_agent_steps and not self._agents:
             raise ValueError("Workflow must have at least one agent when using agent steps")
 
+        # The name index makes reference validation one set lookup per step.
+        # Duplicate names would silently collapse in the name-keyed emission
+        # below (and corrupt the topological counts), so reject them here.
+        seen_names: set[str] = set()
+        for step in self._steps:
+            name = step["name"]
+            if name in seen_names:
+                raise ValueError(f"Duplicate step name {name!r}")
+            seen_names.add(name)
+            step_agent = step.get("agent")
+            if step_agent is not None and step_agent not in self._agents_by_name:
+                raise ValueError(
+                    f"Step {step['name']!r} references undeclared agent {step_agent!r}"
+                )
+
+        # Fail fast on cyclic dependsOn graphs instead of deferring to the
+        # runtime scheduler; the order is cached for downstream consumers.
+        self._topo_order = _topological_step_order(self._steps)
+
         swarm: dict[str, Any] = {"pattern": self._pattern}
         if self._max_concurrency is not None:
             swarm["maxConcurrency"] = self._max_concurrency
@@ -358,6 +458,12 @@ class WorkflowBuilder:
         if self._idle_nudge is not None:
             swarm["idleNudge"] = dict(self._idle_nudge)
 
+        # Emit steps in the topological order computed above. The ready queue
+        # always picks the earliest-declared satisfiable step, so an already
+        # valid declaration order is emitted unchanged and only forward
+        # references get reordered; consumers can then resolve dependsOn
+        # against already-seen steps.
+        step_by_name = {step["name"]: step for step in self._steps}
         config: dict[str, Any] = {
             "version": "1.0",
             "name": self._name,
@@ -366,7 +472,9 @@ class WorkflowBuilder:
             "workflows": [
                 {
                     "name": f"{self._name}-workflow",
-                    "steps": copy.deepcopy(self._steps),
+                    "steps": copy.deepcopy(
+                        [step_by_name[name] for name in self._topo_order]
+                    ),
                 }
             ],
         }
@@ -384,11 +492,22 @@ class WorkflowBuilder:
                 False if self._trajectories is False else dict(self._trajectories)
             )
 
-        return config
+        # Cache the assembled config; callers get an independent copy so
+        # mutating a returned dict cannot poison later builds.
+        self._config_cache = config
+        return copy.deepcopy(config)
 
     def to_yaml(self) -> str:
         """Serialize the config to a YAML string."""
-        return yaml.dump(self.to_config(), default_flow_style=False, sort_keys=False)
+        if self._yaml_cache is None:
+            _ensure_yaml()
+            self._yaml_cache = yaml.dump(
+                self.to_config(),
+                Dumper=_YAML_DUMPER,
+                default_flow_style=False,
+                sort_keys=False,
+            )
+        return self._yaml_cache
 
     def dry_run(self, options: RunOptions | None = None) -> WorkflowResult:
         """Validate the workflow and show execution plan without running."""
@@ -445,6 +564,7 @@ def run_yaml(yaml_path: str, options: RunOptions | None = None) -> WorkflowResul
     if opts.trajectories is None and not opts.vars:
         return _run_yaml_path(yaml_path, opts)
 
+    _ensure_yaml()
     parsed = yaml.safe_load(Path(yaml_path).read_text(encoding="utf-8"))
     if not isinstance(parsed, dict):
         raise ValueError(f"YAML config must decode to an object: {yaml_path}")
@@ -452,6 +572,44 @@ def run_yaml(yaml_path: str, options: RunOptions | None = None) -> WorkflowResul
     return _run_config(config, opts)
 
 
+def _topological_step_order(steps: list[dict[str, Any]]) -> list[str]:
+    """Order step names topologically via Kahn's algorithm.
+
+    Only ``dependsOn`` references to known steps count as edges. The ready
+    queue is a heap keyed by declaration index, so a declaration order that
+    is already valid comes back unchanged and only forward references move.
+    Raises ``ValueError`` if the dependency graph contains a cycle.
+    """
+    names = {step["name"] for step in steps}
+    index_of = {step["name"]: index for index, step in enumerate(steps)}
+    dep_count: dict[str, int] = {}
+    dependents: dict[str, list[str]] = defaultdict(list)
+    for step in steps:
+        name = step["name"]
+        deps = [dep for dep in step.get("dependsOn", ()) if dep in names]
+        dep_count[name] = len(deps)
+        for dep in deps:
+            dependents[dep].append(name)
+
+    ready = [index_of[name] for name, count in dep_count.items() if count == 0]
+    heapq.heapify(ready)
+    order: list[str] = []
+    while ready:
+        name = steps[heapq.heappop(ready)]["name"]
+        order.append(name)
+        for dependent in dependents[name]:
+            dep_count[dependent] -= 1
+            if dep_count[dependent] == 0:
+                heapq.heappush(ready, index_of[dependent])
+
+    if len(order) < len(dep_count):
+        cyclic = sorted(name for name, count in dep_count.items() if count > 0)
+        raise ValueError(
+            "Workflow steps contain a dependency cycle involving: " + ", ".join(cyclic)
+        )
+    return order
+
+
 def _find_agent_relay() -> list[str] | None:
     """Find the agent-relay binary on PATH or via npx. Returns command prefix."""
     binary = shutil.which("agent-relay")
@@ -484,10 +642,13 @@ def _run_yaml_path(yaml_path: str, options: RunOptions) -> WorkflowResult:
 
 def _run_config(config: dict[str, Any], options: RunOptions) -> WorkflowResult:
     """Write config to a temp YAML file and run it through the CLI."""
+    _ensure_yaml()
     with tempfile.NamedTemporaryFile(
         mode="w", suffix=".yaml", prefix="relay-workflow-", delete=False
     ) as file:
-        yaml.dump(config, file, default_flow_style=False, sort_keys=False)
+        yaml.dump(
+            config, file, Dumper=_YAML_DUMPER, default_flow_style=False, sort_keys=False
+        )
         yaml_path = file.name
 
     try:
@@ -567,52 +728,53 @@ def _execute_cli(
     )
 
 
+# Status-keyed factories so event construction is one dict lookup after the
+# regex match instead of a comparison ladder per CLI line.
+_RUN_EVENT_FACTORIES = {
+    "started": lambda run_id, detail: RunStartedEvent(run_id=run_id),
+    "completed": lambda run_id, detail: RunCompletedEvent(run_id=run_id),
+    "failed": lambda run_id, detail: RunFailedEvent(
+        run_id=run_id, error=detail or "Workflow failed"
+    ),
+    "cancelled": lambda run_id, detail: RunCancelledEvent(run_id=run_id),
+}
+
+_STEP_EVENT_FACTORIES = {
+    "started": lambda run_id, step_name, detail: StepStartedEvent(
+        run_id=run_id, step_name=step_name
+    ),
+    "completed": lambda run_id, step_name, detail: StepCompletedEvent(
+        run_id=run_id, step_name=step_name
+    ),
+    "failed": lambda run_id, step_name, detail: StepFailedEvent(
+        run_id=run_id, step_name=step_name, error=detail or "Step failed"
+    ),
+    "skipped": lambda run_id, step_name, detail: StepSkippedEvent(
+        run_id=run_id, step_name=step_name
+    ),
+    "retrying": lambda run_id, step_name, detail: StepRetryingEvent(
+        run_id=run_id, step_name=step_name, attempt=_extract_int(detail)
+    ),
+    "nudged": lambda run_id, step_name, detail: StepNudgedEvent(
+        run_id=run_id, step_name=step_name, nudge_count=_extract_int(detail)
+    ),
+    "force-released": lambda run_id, step_name, detail: StepForceReleasedEvent(
+        run_id=run_id, step_name=step_name
+    ),
+}
+
+
 def _parse_cli_event(line: str, *, run_id: str = "") -> WorkflowEvent | None:
     """Parse a CLI log line into a typed workflow event."""
     run_match = _RUN_LINE_RE.match(line)
     if run_match:
-        status = run_match.group(1)
-        detail = run_match.group(2)
-        if status == "started":
-            return RunStartedEvent(run_id=run_id)
-        if status == "completed":
-            return RunCompletedEvent(run_id=run_id)
-        if status == "failed":
-            return RunFailedEvent(run_id=run_id, error=detail or "Workflow failed")
-        if status == "cancelled":
-            return RunCancelledEvent(run_id=run_id)
+        return _RUN_EVENT_FACTORIES[run_match.group(1)](run_id, run_match.group(2))
 
     step_match = _STEP_LINE_RE.match(line)
     if step_match:
-        step_name = step_match.group(1)
-        status = step_match.group(2)
-        detail = step_match.group(3)
-        if status == "started":
-            return StepStartedEvent(run_id=run_id, step_name=step_name)
-        if status == "completed":
-            return StepCompletedEvent(run_id=run_id, step_name=step_name)
-        if status == "failed":
-            return StepFailedEvent(
-                run_id=run_id,
-                step_name=step_name,
-                error=detail or "Step failed",
-            )
-        if status == "skipped":
-            return StepSkippedEvent(run_id=run_id, step_name=step_name)
-        if status == "retrying":
-            return StepRetryingEvent(
-                run_id=run_id,
-                step_name=step_name,
-                attempt=_extract_int(detail),
-            )
-        if status == "nudged":
-            return StepNudgedEvent(
-                run_id=run_id,
-                step_name=step_name,
-                nudge_count=_extract_int(detail),
-            )
-        if status == "force-released":
-            return StepForceReleasedEvent(run_id=run_id, step_name=step_name)
+        return _STEP_EVENT_FACTORIES[step_match.group(2)](
+            run_id, step_match.group(1), step_match.group(3)
+        )
 
     return None
 
@@ -664,9 +826,15 @@ def _sync_step_result(steps: dict[str, StepResult], event: WorkflowEvent) -> Non
 
 def _parse_step_results(output: str) -> list[StepResult]:
     """Fallback parser for step lines if no events were captured live."""
-    lines = output.split("\n") if output else []
     steps: list[StepResult] = []
-    for line in lines:
+    pos = 0
+    size = len(output)
+    while pos < size:
+        newline = output.find("\n", pos)
+        if newline == -1:
+            line, pos = output[pos:], size
+        else:
+            line, pos = output[pos:newline], newline + 1
         event = _parse_cli_event(line)
         if isinstance(event, StepCompletedEvent):
             steps.append(StepResult(name=event.step_name, status="completed"))
@@ -696,10 +864,11 @@ def _resolve_error(output: str, events: list[WorkflowEvent], return_code: int) -
         if isinstance(event, RunFailedEvent) and event.error:
             return event.error
 
-    for line in reversed(output.splitlines()):
-        text = line.strip()
-        if text:
-            return text
+    # Slice out the last non-empty line directly rather than materializing
+    # every line of a potentially large CLI transcript.
+    tail = output.rstrip()
+    if tail:
+        return tail[tail.rfind("\n") + 1 :].strip()
 
     return "Workflow failed"
 
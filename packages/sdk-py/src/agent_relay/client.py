@@ -12,6 +12,7 @@ import asyncio
 import json
 import os
 import platform
+import re
 import secrets
 import shutil
 from pathlib import Path
@@ -174,16 +175,19 @@ class AgentRelayClient:
             env=spawn_env,
         )
 
-        # Forward stderr
+        # Forward stderr. Without a callback there is nothing to deliver, so
+        # drain in large chunks instead of paying a decode per log line.
         async def _read_stderr() -> None:
             assert process.stderr
+            if on_stderr is None:
+                while await process.stderr.read(65536):
+                    pass
+                return
             while True:
                 line = await process.stderr.readline()
                 if not line:
                     break
-                text = line.decode("utf-8", errors="replace").rstrip("\n")
-                if on_stderr:
-                    on_stderr(text)
+                on_stderr(line.decode("utf-8", errors="replace").rstrip("\n"))
 
         stderr_task = asyncio.create_task(_read_stderr())
 
@@ -229,7 +233,12 @@ class AgentRelayClient:
             headers: dict[str, str] = {"Content-Type": "application/json"}
             if self._api_key:
                 headers["X-API-Key"] = self._api_key
-            self._session = aiohttp.ClientSession(headers=headers)
+            # Explicit keep-alive pool so back-to-back API calls reuse one
+            # TCP connection to the broker instead of re-handshaking.
+            self._session = aiohttp.ClientSession(
+                headers=headers,
+                connector=aiohttp.TCPConnector(limit=64, keepalive_timeout=60),
+            )
         return self._session
 
     async def _request(self, method: str, path: str, **kwargs: Any) -> Any:
@@ -503,12 +512,6 @@ class AgentRelayClient:
         if self._ws_task and not self._ws_task.done():
             self._ws_task.cancel()
 
-        if self._stderr_task and not self._stderr_task.done():
-            self._stderr_task.cancel()
-
-        if self._stdout_task and not self._stdout_task.done():
-            self._stdout_task.cancel()
-
         if self._session and not self._session.closed:
             await self._session.close()
 
@@ -519,6 +522,18 @@ class AgentRelayClient:
                 self._process.kill()
             self._process = None
 
+        # The pipe readers hit EOF once the broker exits; give them a moment
+        # to drain the final log lines before resorting to cancellation.
+        readers = [
+            task
+            for task in (self._stderr_task, self._stdout_task)
+            if task and not task.done()
+        ]
+        if readers:
+            _, pending = await asyncio.wait(readers, timeout=1.0)
+            for task in pending:
+                task.cancel()
+
     async def wait_for_exit(self) -> None:
         if self._process:
             await self._process.wait()
@@ -530,6 +545,8 @@ class AgentRelayClient:
 
 # ── Helpers ───────────────────────────────────────────────────────────────────
 
+_API_URL_PATTERN = re.compile(r"API listening on (https?://\S+)")
+
 
 async def _wait_for_api_url(
     process: asyncio.subprocess.Process,
@@ -540,10 +557,7 @@ async def _wait_for_api_url(
     The broker prints: [agent-relay] API listening on http://{bind}:{port}
     Returns the full URL (e.g. "http://127.0.0.1:3889").
     """
-    import re
-
     assert process.stdout
-    pattern = re.compile(r"API listening on (https?://\S+)")
 
     async def _read() -> str:
         assert process.stdout
@@ -553,8 +567,12 @@ async def _wait_for_api_url(
                 raise AgentRelayProcessError(
                     f"Broker process exited with code {process.returncode} before becoming ready"
                 )
+            # Cheap bytes check first — skip decoding the (potentially noisy)
+            # startup log lines that can't contain the URL.
+            if b"API listening on" not in line_bytes:
+                continue
             line = line_bytes.decode("utf-8", errors="replace").rstrip("\n")
-            match = pattern.search(line)
+            match = _API_URL_PATTERN.search(line)
             if match:
                 return match.group(1)
 
@@ -9,9 +9,9 @@ if TYPE_CHECKING:
 
 
 def _format_instructions_with_inbox(messages: list[Any], base_instructions: str) -> str:
-    content = "New messages from other agents:\n"
-    for message in messages:
-        content += f"  {message.sender}: {message.text}\n"
+    content = "New messages from other agents:\n" + "".join(
+        f"  {message.sender}: {message.text}\n" for message in messages
+    )
     if base_instructions:
         return f"\n\n{content}\n{base_instructions}"
     return content
@@ -38,10 +38,9 @@ def on_relay(options: Any, relay: "Relay | None" = None, *, name: str | None = N
     async def _drain_to_system_message() -> str | None:
         messages = await relay.inbox()
         if not messages: return None
-        content = "\n\nNew messages from other agents:\n"
-        for m in messages:
-            content += f"  Relay message from {m.sender}: {m.text}\n"
-        return content
+        return "\n\nNew messages from other agents:\n" + "".join(
+            f"  Relay message from {m.sender}: {m.text}\n" for m in messages
+        )
 
     # 3. Hook wrappers
     orig_post = options.hooks.post_tool_use if hasattr(options.hooks, "post_tool_use") else None
@@ -16,9 +16,9 @@ def _format_backstory(messages: list[Any], base_backstory: str) -> str:
     if not messages:
         return base_backstory
 
-    content = "\n\nNew messages from other agents:\n"
-    for message in messages:
-        content += f"  {message.sender}: {message.text}\n"
+    content = "\n\nNew messages from other agents:\n" + "".join(
+        f"  {message.sender}: {message.text}\n" for message in messages
+    )
     return f"{content}\n{base_backstory}" if base_backstory else content
 
 
@@ -594,11 +594,28 @@ class AgentRelay:
     async def list_agents(self) -> list[Agent]:
         client = await self._ensure_started()
         raw_list = await client.list_agents()
+
+        # Fast path: the server set matches our cache, so reuse the existing
+        # handles instead of rebuilding Agent objects per call. Mutable
+        # fields still refresh from the server, and results keep server order.
+        server_names = {entry.get("name", "") for entry in raw_list}
+        if server_names == self._known_agents.keys():
+            agents = []
+            for entry in raw_list:
+                existing = self._known_agents[entry.get("name", "")]
+                existing._runtime = entry.get("runtime", existing._runtime)
+                existing._channels = entry.get("channels", existing._channels)
+                agents.append(existing)
+            return agents
+
+        # Reconcile: the server is the source of truth.
         agents = []
         for entry in raw_list:
             name = entry.get("name", "")
             existing = self._known_agents.get(name)
             if existing:
+                existing._runtime = entry.get("runtime", existing._runtime)
+                existing._channels = entry.get("channels", existing._channels)
                 agents.append(existing)
             else:
                 agent = Agent(
@@ -610,6 +627,9 @@ class AgentRelay:
                 )
                 self._known_agents[name] = agent
                 agents.append(agent)
+        for name in list(self._known_agents):
+            if name not in server_names:
+                self._known_agents.pop(name, None)
         return agents
 
     async def preflight_agents(self, agents: list[dict[str, str]]) -> None:
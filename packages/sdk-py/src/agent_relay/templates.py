@@ -2,15 +2,26 @@
 
 from __future__ import annotations
 
-import re
+import copy
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Sequence
 
 from .builder import WorkflowBuilder, workflow
-from .types import AgentCli, VerificationCheck
+from .types import AgentCli, AgentDefinition, VerificationCheck, WorkflowStep
 
+# Maps every ASCII character outside [A-Za-z0-9_-] to a sentinel in one
+# C-level pass; runs of the sentinel then collapse to a single "-" without
+# touching dashes already present in the input. No regex involved, so this
+# module adds nothing beyond .builder/.types to import time.
+_SLUG_SENTINEL = "\x00"
+_SLUG_TABLE = {
+    c: (chr(c) if chr(c).isalnum() or chr(c) in "_-" else _SLUG_SENTINEL)
+    for c in range(128)
+}
 
-@dataclass
+
+@dataclass(slots=True)
 class TemplateAgent:
     name: str
     cli: AgentCli = "claude"
@@ -25,7 +36,7 @@ class TemplateAgent:
     interactive: bool | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class TemplateStep:
     name: str
     agent: str
@@ -36,7 +47,7 @@ class TemplateStep:
     retries: int | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class PipelineStage:
     name: str
     task: str
@@ -66,20 +77,56 @@ def fan_out(
     if not tasks:
         raise ValueError("fan_out template requires at least one task")
 
+    # All inputs are hashable, so construction is memoized; hand the caller
+    # an independent copy so mutating the returned builder can't poison the
+    # cached template. pipeline()/dag() take unhashable stage/agent objects
+    # and stay uncached.
+    builder = _fan_out_cached(
+        name,
+        tuple(tasks),
+        worker_cli,
+        worker_role,
+        worker_interactive,
+        synthesis_task,
+        synthesis_agent,
+        synthesis_cli,
+        synthesis_role,
+    )
+    return copy.deepcopy(builder)
+
+
+@lru_cache(maxsize=256)
+def _fan_out_cached(
+    name: str,
+    tasks: tuple[str, ...],
+    worker_cli: AgentCli,
+    worker_role: str,
+    worker_interactive: bool,
+    synthesis_task: str | None,
+    synthesis_agent: str,
+    synthesis_cli: AgentCli,
+    synthesis_role: str,
+) -> WorkflowBuilder:
     builder = workflow(name).pattern("fan-out")
-    worker_steps: list[str] = []
 
-    for index, task in enumerate(tasks, start=1):
-        agent_name = f"worker-{index}"
-        step_name = f"task-{index}"
-        builder.agent(
-            agent_name,
+    # Build the definitions as plain lists and hand them to the builder's
+    # bulk API: one method dispatch instead of two per task.
+    worker_names = ["worker-%d" % index for index in range(1, len(tasks) + 1)]
+    worker_steps = ["task-%d" % index for index in range(1, len(tasks) + 1)]
+    agent_defs = [
+        AgentDefinition(
+            name=agent_name,
             cli=worker_cli,
             role=worker_role,
             interactive=worker_interactive,
         )
-        builder.step(step_name, agent=agent_name, task=task)
-        worker_steps.append(step_name)
+        for agent_name in worker_names
+    ]
+    step_defs = [
+        WorkflowStep(name=step_name, agent=agent_name, task=task)
+        for step_name, agent_name, task in zip(worker_steps, worker_names, tasks)
+    ]
+    builder.bulk_agents(agent_defs).bulk_steps(step_defs)
 
     if synthesis_task is not None:
         builder.agent(synthesis_agent, cli=synthesis_cli, role=synthesis_role)
@@ -104,20 +151,28 @@ def pipeline(
         raise ValueError("pipeline template requires at least one stage")
 
     builder = workflow(name).pattern("pipeline")
-    defined_agents: set[str] = set()
-    previous_step: str | None = None
 
-    for index, stage in enumerate(stages, start=1):
-        agent_name = stage.agent or _slug(f"{stage.name}-agent", f"stage-agent-{index}")
-        if agent_name not in defined_agents:
-            builder.agent(
-                agent_name,
-                cli=stage.cli or default_cli,
-                role=stage.role,
-                interactive=stage.interactive,
-            )
-            defined_agents.add(agent_name)
+    # Resolve all agent names up front, then emit agents and steps in two
+    # tight passes instead of interleaving slug/set/emit work per stage.
+    agent_names = [
+        stage.agent or _slug(f"{stage.name}-agent", f"stage-agent-{index}")
+        for index, stage in enumerate(stages, start=1)
+    ]
+
+    defining_stages: dict[str, PipelineStage] = {}
+    for agent_name, stage in zip(agent_names, stages):
+        if agent_name not in defining_stages:
+            defining_stages[agent_name] = stage
+    for agent_name, stage in defining_stages.items():
+        builder.agent(
+            agent_name,
+            cli=stage.cli or default_cli,
+            role=stage.role,
+            interactive=stage.interactive,
+        )
 
+    previous_step: str | None = None
+    for agent_name, stage in zip(agent_names, stages):
         dependencies: list[str] = []
         if previous_step is not None:
             dependencies.append(previous_step)
@@ -193,5 +248,15 @@ class WorkflowTemplates:
 
 
 def _slug(value: str, fallback: str) -> str:
-    normalized = re.sub(r"[^a-zA-Z0-9_-]+", "-", value).strip("-").lower()
+    if value.isascii():
+        translated = value.translate(_SLUG_TABLE)
+    else:
+        translated = "".join(
+            ch if ch.isascii() and (ch.isalnum() or ch in "_-") else _SLUG_SENTINEL
+            for ch in value
+        )
+    # Splitting on the sentinel and rejoining collapses each invalid-char run
+    # to a single dash, matching the old [^a-zA-Z0-9_-]+ regex substitution.
+    parts = [part for part in translated.split(_SLUG_SENTINEL) if part]
+    normalized = "-".join(parts).strip("-").lower()
     return normalized or fallback
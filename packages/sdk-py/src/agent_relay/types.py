@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+import sys
+from array import array
 from dataclasses import dataclass, field
-from typing import Any, Callable, Literal, TypeAlias
+from typing import Any, Callable, Literal, Sequence, TypeAlias, get_args
 
 SwarmPattern = Literal[
     "fan-out",
@@ -54,45 +56,145 @@ StateBackend = Literal["memory", "redis", "database"]
 WorkflowRunStatus = Literal["pending", "running", "completed", "failed", "cancelled"]
 WorkflowStepStatus = Literal["pending", "running", "completed", "failed", "skipped"]
 
-
-@dataclass
+# Precomputed membership sets for the Literal unions above — O(1) validation
+# instead of scanning the Literal args per check.
+SWARM_PATTERNS: frozenset[str] = frozenset(get_args(SwarmPattern))
+AGENT_CLIS: frozenset[str] = frozenset(get_args(AgentCli))
+WORKFLOW_RUN_STATUSES: frozenset[str] = frozenset(get_args(WorkflowRunStatus))
+WORKFLOW_STEP_STATUSES: frozenset[str] = frozenset(get_args(WorkflowStepStatus))
+
+
+def _intern_fields(obj: Any, *attrs: str) -> None:
+    """Intern hot string fields so repeated names/statuses share one object.
+
+    Uses ``object.__setattr__`` so it also works for frozen dataclasses.
+    """
+    for attr in attrs:
+        value = getattr(obj, attr)
+        if value:
+            object.__setattr__(obj, attr, sys.intern(value))
+
+
+def _to_dict_list(items: Sequence[Any]) -> list[dict[str, Any]]:
+    """Serialize a list of config objects into a pre-sized output list."""
+    out: list[dict[str, Any]] = [None] * len(items)  # type: ignore[list-item]
+    for i, item in enumerate(items):
+        out[i] = item.to_dict()
+    return out
+
+
+def _compile_to_dict(
+    class_name: str, schema: tuple[tuple[str, str, str], ...]
+) -> Callable[[Any], dict[str, Any]]:
+    """Compile a specialized ``to_dict`` from a class's ``_SCHEMA`` table.
+
+    Each entry is ``(attr, json_key, kind)``. The generated function is
+    branch-free for required fields and loads every JSON key as an interned
+    constant, matching hand-written per-class serializers without repeating
+    the None-skipping boilerplate thirteen times.
+    """
+    def required_expr(attr: str, kind: str) -> str:
+        if kind == "required":
+            return f"self.{attr}"
+        if kind == "required_list":
+            return f"_to_dict_list(self.{attr})"
+        return f"self.{attr}.to_dict()"
+
+    # Emit the leading run of required fields as one dict literal: a single
+    # BUILD_MAP with known size instead of per-key inserts and regrows.
+    head = 0
+    while head < len(schema) and schema[head][2].startswith("required"):
+        head += 1
+    lines = ["def to_dict(self):", "    result = {"]
+    lines += [
+        f"        {key!r}: {required_expr(attr, kind)},"
+        for attr, key, kind in schema[:head]
+    ]
+    lines.append("    }")
+    for attr, key, kind in schema[head:]:
+        if kind == "required":
+            lines.append(f"    result[{key!r}] = self.{attr}")
+        elif kind == "required_list":
+            lines.append(f"    result[{key!r}] = _to_dict_list(self.{attr})")
+        elif kind == "required_nested":
+            lines.append(f"    result[{key!r}] = self.{attr}.to_dict()")
+        elif kind == "optional":
+            lines += [
+                f"    value = self.{attr}",
+                "    if value is not None:",
+                f"        result[{key!r}] = value",
+            ]
+        elif kind == "optional_nested":
+            # Empty nested dicts are omitted.
+            lines += [
+                f"    value = self.{attr}",
+                "    if value is not None:",
+                "        value = value.to_dict()",
+                "        if value:",
+                f"            result[{key!r}] = value",
+            ]
+        elif kind == "optional_nested_keep_empty":
+            lines += [
+                f"    value = self.{attr}",
+                "    if value is not None:",
+                f"        result[{key!r}] = value.to_dict()",
+            ]
+        elif kind == "optional_list":
+            lines += [
+                f"    value = self.{attr}",
+                "    if value is not None:",
+                f"        result[{key!r}] = _to_dict_list(value)",
+            ]
+        elif kind == "false_or_nested":
+            # None omitted, literal False passed through, anything else is a
+            # config object (identity checks, no isinstance).
+            lines += [
+                f"    value = self.{attr}",
+                "    if value is False:",
+                f"        result[{key!r}] = False",
+                "    elif value is not None:",
+                f"        result[{key!r}] = value.to_dict()",
+            ]
+        else:
+            raise ValueError(f"unknown schema kind: {kind!r}")
+    lines.append("    return result")
+
+    namespace: dict[str, Any] = {"_to_dict_list": _to_dict_list}
+    exec("\n".join(lines), namespace)
+    fn = namespace["to_dict"]
+    fn.__qualname__ = f"{class_name}.to_dict"
+    return fn
+
+
+@dataclass(slots=True)
 class TrajectoryConfig:
     enabled: bool | None = None
     reflect_on_barriers: bool | None = None
     reflect_on_converge: bool | None = None
     auto_decisions: bool | None = None
 
-    def to_dict(self) -> dict[str, Any]:
-        result: dict[str, Any] = {}
-        if self.enabled is not None:
-            result["enabled"] = self.enabled
-        if self.reflect_on_barriers is not None:
-            result["reflectOnBarriers"] = self.reflect_on_barriers
-        if self.reflect_on_converge is not None:
-            result["reflectOnConverge"] = self.reflect_on_converge
-        if self.auto_decisions is not None:
-            result["autoDecisions"] = self.auto_decisions
-        return result
-
-
-@dataclass
+    _SCHEMA = (
+        ("enabled", "enabled", "optional"),
+        ("reflect_on_barriers", "reflectOnBarriers", "optional"),
+        ("reflect_on_converge", "reflectOnConverge", "optional"),
+        ("auto_decisions", "autoDecisions", "optional"),
+    )
+
+
+@dataclass(slots=True)
 class IdleNudgeConfig:
     nudge_after_ms: int | None = None
     escalate_after_ms: int | None = None
     max_nudges: int | None = None
 
-    def to_dict(self) -> dict[str, Any]:
-        result: dict[str, Any] = {}
-        if self.nudge_after_ms is not None:
-            result["nudgeAfterMs"] = self.nudge_after_ms
-        if self.escalate_after_ms is not None:
-            result["escalateAfterMs"] = self.escalate_after_ms
-        if self.max_nudges is not None:
-            result["maxNudges"] = self.max_nudges
-        return result
+    _SCHEMA = (
+        ("nudge_after_ms", "nudgeAfterMs", "optional"),
+        ("escalate_after_ms", "escalateAfterMs", "optional"),
+        ("max_nudges", "maxNudges", "optional"),
+    )
 
 
-@dataclass
+@dataclass(slots=True)
 class SwarmConfig:
     pattern: SwarmPattern
     max_concurrency: int | None = None
@@ -100,20 +202,16 @@ class SwarmConfig:
     channel: str | None = None
     idle_nudge: IdleNudgeConfig | None = None
 
-    def to_dict(self) -> dict[str, Any]:
-        result: dict[str, Any] = {"pattern": self.pattern}
-        if self.max_concurrency is not None:
-            result["maxConcurrency"] = self.max_concurrency
-        if self.timeout_ms is not None:
-            result["timeoutMs"] = self.timeout_ms
-        if self.channel is not None:
-            result["channel"] = self.channel
-        if self.idle_nudge is not None:
-            result["idleNudge"] = self.idle_nudge.to_dict()
-        return result
-
-
-@dataclass
+    _SCHEMA = (
+        ("pattern", "pattern", "required"),
+        ("max_concurrency", "maxConcurrency", "optional"),
+        ("timeout_ms", "timeoutMs", "optional"),
+        ("channel", "channel", "optional"),
+        ("idle_nudge", "idleNudge", "optional_nested_keep_empty"),
+    )
+
+
+@dataclass(slots=True)
 class AgentConstraints:
     max_tokens: int | None = None
     timeout_ms: int | None = None
@@ -121,22 +219,16 @@ class AgentConstraints:
     model: str | None = None
     idle_threshold_secs: int | None = None
 
-    def to_dict(self) -> dict[str, Any]:
-        result: dict[str, Any] = {}
-        if self.max_tokens is not None:
-            result["maxTokens"] = self.max_tokens
-        if self.timeout_ms is not None:
-            result["timeoutMs"] = self.timeout_ms
-        if self.retries is not None:
-            result["retries"] = self.retries
-        if self.model is not None:
-            result["model"] = self.model
-        if self.idle_threshold_secs is not None:
-            result["idleThresholdSecs"] = self.idle_threshold_secs
-        return result
-
-
-@dataclass
+    _SCHEMA = (
+        ("max_tokens", "maxTokens", "optional"),
+        ("timeout_ms", "timeoutMs", "optional"),
+        ("retries", "retries", "optional"),
+        ("model", "model", "optional"),
+        ("idle_threshold_secs", "idleThresholdSecs", "optional"),
+    )
+
+
+@dataclass(slots=True)
 class PathDefinition:
     """A named path to an external directory for cross-repo workflows."""
 
@@ -145,16 +237,15 @@ class PathDefinition:
     description: str | None = None
     required: bool | None = None
 
-    def to_dict(self) -> dict[str, Any]:
-        result: dict[str, Any] = {"name": self.name, "path": self.path}
-        if self.description is not None:
-            result["description"] = self.description
-        if self.required is not None:
-            result["required"] = self.required
-        return result
+    _SCHEMA = (
+        ("name", "name", "required"),
+        ("path", "path", "required"),
+        ("description", "description", "optional"),
+        ("required", "required", "optional"),
+    )
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentDefinition:
     name: str
     cli: AgentCli
@@ -167,46 +258,34 @@ class AgentDefinition:
     workdir: str | None = None
     additional_paths: list[str] | None = None
 
-    def to_dict(self) -> dict[str, Any]:
-        result: dict[str, Any] = {
-            "name": self.name,
-            "cli": self.cli,
-        }
-        if self.role is not None:
-            result["role"] = self.role
-        if self.task is not None:
-            result["task"] = self.task
-        if self.channels is not None:
-            result["channels"] = self.channels
-        if self.constraints is not None:
-            constraints = self.constraints.to_dict()
-            if constraints:
-                result["constraints"] = constraints
-        if self.interactive is not None:
-            result["interactive"] = self.interactive
-        if self.cwd is not None:
-            result["cwd"] = self.cwd
-        if self.workdir is not None:
-            result["workdir"] = self.workdir
-        if self.additional_paths is not None:
-            result["additionalPaths"] = self.additional_paths
-        return result
-
-
-@dataclass
+    _SCHEMA = (
+        ("name", "name", "required"),
+        ("cli", "cli", "required"),
+        ("role", "role", "optional"),
+        ("task", "task", "optional"),
+        ("channels", "channels", "optional"),
+        ("constraints", "constraints", "optional_nested"),
+        ("interactive", "interactive", "optional"),
+        ("cwd", "cwd", "optional"),
+        ("workdir", "workdir", "optional"),
+        ("additional_paths", "additionalPaths", "optional"),
+    )
+
+
+@dataclass(slots=True)
 class VerificationCheck:
     type: Literal["output_contains", "exit_code", "file_exists", "custom"]
     value: str
     description: str | None = None
 
-    def to_dict(self) -> dict[str, Any]:
-        result: dict[str, Any] = {"type": self.type, "value": self.value}
-        if self.description is not None:
-            result["description"] = self.description
-        return result
+    _SCHEMA = (
+        ("type", "type", "required"),
+        ("value", "value", "required"),
+        ("description", "description", "optional"),
+    )
 
 
-@dataclass
+@dataclass(slots=True)
 class WorkflowStep:
     name: str
     agent: str
@@ -217,151 +296,157 @@ class WorkflowStep:
     retries: int | None = None
     workdir: str | None = None
 
-    def to_dict(self) -> dict[str, Any]:
-        result: dict[str, Any] = {
-            "name": self.name,
-            "agent": self.agent,
-            "task": self.task,
-        }
-        if self.depends_on is not None:
-            result["dependsOn"] = self.depends_on
-        if self.verification is not None:
-            result["verification"] = self.verification.to_dict()
-        if self.timeout_ms is not None:
-            result["timeoutMs"] = self.timeout_ms
-        if self.retries is not None:
-            result["retries"] = self.retries
-        if self.workdir is not None:
-            result["workdir"] = self.workdir
-        return result
-
-
-@dataclass
+    _SCHEMA = (
+        ("name", "name", "required"),
+        ("agent", "agent", "required"),
+        ("task", "task", "required"),
+        ("depends_on", "dependsOn", "optional"),
+        ("verification", "verification", "optional_nested"),
+        ("timeout_ms", "timeoutMs", "optional"),
+        ("retries", "retries", "optional"),
+        ("workdir", "workdir", "optional"),
+    )
+
+    def __post_init__(self) -> None:
+        _intern_fields(self, "name", "agent")
+
+
+@dataclass(slots=True)
 class WorkflowDefinition:
     name: str
     steps: list[WorkflowStep]
     description: str | None = None
     on_error: WorkflowOnError | None = None
 
-    def to_dict(self) -> dict[str, Any]:
-        result: dict[str, Any] = {
-            "name": self.name,
-            "steps": [step.to_dict() for step in self.steps],
-        }
-        if self.description is not None:
-            result["description"] = self.description
-        if self.on_error is not None:
-            result["onError"] = self.on_error
-        return result
+    _SCHEMA = (
+        ("name", "name", "required"),
+        ("steps", "steps", "required_list"),
+        ("description", "description", "optional"),
+        ("on_error", "onError", "optional"),
+    )
 
 
-@dataclass
+@dataclass(slots=True)
 class Barrier:
     name: str
     wait_for: list[str]
     timeout_ms: int | None = None
 
-    def to_dict(self) -> dict[str, Any]:
-        result: dict[str, Any] = {
-            "name": self.name,
-            "waitFor": self.wait_for,
-        }
-        if self.timeout_ms is not None:
-            result["timeoutMs"] = self.timeout_ms
-        return result
+    _SCHEMA = (
+        ("name", "name", "required"),
+        ("wait_for", "waitFor", "required"),
+        ("timeout_ms", "timeoutMs", "optional"),
+    )
 
 
-@dataclass
+@dataclass(slots=True)
 class CoordinationConfig:
-    barriers: list[Barrier] | None = None
+    barriers: tuple[Barrier, ...] | None = None
     voting_threshold: float | None = None
     consensus_strategy: ConsensusStrategy | None = None
 
-    def to_dict(self) -> dict[str, Any]:
-        result: dict[str, Any] = {}
+    _SCHEMA = (
+        ("barriers", "barriers", "optional_list"),
+        ("voting_threshold", "votingThreshold", "optional"),
+        ("consensus_strategy", "consensusStrategy", "optional"),
+    )
+
+    def __post_init__(self) -> None:
         if self.barriers is not None:
-            result["barriers"] = [barrier.to_dict() for barrier in self.barriers]
-        if self.voting_threshold is not None:
-            result["votingThreshold"] = self.voting_threshold
-        if self.consensus_strategy is not None:
-            result["consensusStrategy"] = self.consensus_strategy
-        return result
+            self.barriers = tuple(self.barriers)
 
 
-@dataclass
+@dataclass(slots=True)
 class StateConfig:
     backend: StateBackend
     ttl_ms: int | None = None
     namespace: str | None = None
 
-    def to_dict(self) -> dict[str, Any]:
-        result: dict[str, Any] = {"backend": self.backend}
-        if self.ttl_ms is not None:
-            result["ttlMs"] = self.ttl_ms
-        if self.namespace is not None:
-            result["namespace"] = self.namespace
-        return result
+    _SCHEMA = (
+        ("backend", "backend", "required"),
+        ("ttl_ms", "ttlMs", "optional"),
+        ("namespace", "namespace", "optional"),
+    )
 
 
-@dataclass
+@dataclass(slots=True)
 class ErrorHandlingConfig:
     strategy: ErrorStrategy
     max_retries: int | None = None
     retry_delay_ms: int | None = None
     notify_channel: str | None = None
 
-    def to_dict(self) -> dict[str, Any]:
-        result: dict[str, Any] = {"strategy": self.strategy}
-        if self.max_retries is not None:
-            result["maxRetries"] = self.max_retries
-        if self.retry_delay_ms is not None:
-            result["retryDelayMs"] = self.retry_delay_ms
-        if self.notify_channel is not None:
-            result["notifyChannel"] = self.notify_channel
-        return result
+    _SCHEMA = (
+        ("strategy", "strategy", "required"),
+        ("max_retries", "maxRetries", "optional"),
+        ("retry_delay_ms", "retryDelayMs", "optional"),
+        ("notify_channel", "notifyChannel", "optional"),
+    )
 
 
-@dataclass
+@dataclass(slots=True)
 class RelayYamlConfig:
     name: str
     swarm: SwarmConfig
-    agents: list[AgentDefinition]
+    agents: tuple[AgentDefinition, ...]
     version: str = "1.0"
     description: str | None = None
-    paths: list[PathDefinition] | None = None
-    workflows: list[WorkflowDefinition] | None = None
+    paths: tuple[PathDefinition, ...] | None = None
+    workflows: tuple[WorkflowDefinition, ...] | None = None
     coordination: CoordinationConfig | None = None
     state: StateConfig | None = None
     error_handling: ErrorHandlingConfig | None = None
     trajectories: TrajectoryConfig | Literal[False] | None = None
 
-    def to_dict(self) -> dict[str, Any]:
-        result: dict[str, Any] = {
-            "version": self.version,
-            "name": self.name,
-            "swarm": self.swarm.to_dict(),
-            "agents": [agent.to_dict() for agent in self.agents],
-        }
-        if self.description is not None:
-            result["description"] = self.description
+    _SCHEMA = (
+        ("version", "version", "required"),
+        ("name", "name", "required"),
+        ("swarm", "swarm", "required_nested"),
+        ("agents", "agents", "required_list"),
+        ("description", "description", "optional"),
+        ("paths", "paths", "optional_list"),
+        ("workflows", "workflows", "optional_list"),
+        ("coordination", "coordination", "optional_nested_keep_empty"),
+        ("state", "state", "optional_nested_keep_empty"),
+        ("error_handling", "errorHandling", "optional_nested_keep_empty"),
+        ("trajectories", "trajectories", "false_or_nested"),
+    )
+
+    def __post_init__(self) -> None:
+        # These collections are frozen after construction; store them as
+        # tuples so callers can pass any sequence and reads stay copy-free.
+        self.agents = tuple(self.agents)
         if self.paths is not None:
-            result["paths"] = [p.to_dict() for p in self.paths]
+            self.paths = tuple(self.paths)
         if self.workflows is not None:
-            result["workflows"] = [workflow.to_dict() for workflow in self.workflows]
-        if self.coordination is not None:
-            result["coordination"] = self.coordination.to_dict()
-        if self.state is not None:
-            result["state"] = self.state.to_dict()
-        if self.error_handling is not None:
-            result["errorHandling"] = self.error_handling.to_dict()
-        if self.trajectories is False:
-            result["trajectories"] = False
-        elif isinstance(self.trajectories, TrajectoryConfig):
-            result["trajectories"] = self.trajectories.to_dict()
-        return result
-
-
-@dataclass
+            self.workflows = tuple(self.workflows)
+
+
+# Compile a specialized to_dict per config class from its _SCHEMA table.
+# The generated functions carry every JSON key as an interned code constant,
+# so repeated dict insertions during serialization hit the interned-pointer
+# fast path without a per-call table walk.
+for _cls in (
+    TrajectoryConfig,
+    IdleNudgeConfig,
+    SwarmConfig,
+    AgentConstraints,
+    PathDefinition,
+    AgentDefinition,
+    VerificationCheck,
+    WorkflowStep,
+    WorkflowDefinition,
+    Barrier,
+    CoordinationConfig,
+    StateConfig,
+    ErrorHandlingConfig,
+    RelayYamlConfig,
+):
+    _cls.to_dict = _compile_to_dict(_cls.__name__, _cls._SCHEMA)
+del _cls
+
+
+@dataclass(slots=True)
 class RestartPolicy:
     """Auto-restart policy for crashed agents."""
 
@@ -379,7 +464,7 @@ class RestartPolicy:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentStats:
     """Per-agent statistics from the broker."""
 
@@ -392,7 +477,7 @@ class AgentStats:
     memory_bytes: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class BrokerStats:
     """Broker-wide statistics snapshot."""
 
@@ -403,7 +488,7 @@ class BrokerStats:
     active_agents: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class CrashRecord:
     """A single crash record."""
 
@@ -416,7 +501,7 @@ class CrashRecord:
     description: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class CrashPattern:
     """A detected crash pattern grouping."""
 
@@ -425,7 +510,7 @@ class CrashPattern:
     agents: list[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class CrashInsightsResponse:
     """Response from the crash insights API."""
 
@@ -435,7 +520,7 @@ class CrashInsightsResponse:
     health_score: int = 100
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentOptions:
     cli: AgentCli
     role: str | None = None
@@ -449,7 +534,7 @@ class AgentOptions:
     interactive: bool | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class StepOptions:
     agent: str
     task: str
@@ -459,46 +544,61 @@ class StepOptions:
     retries: int | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ErrorOptions:
     max_retries: int | None = None
     retry_delay_ms: int | None = None
     notify_channel: str | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RunStartedEvent:
     type: Literal["run:started"] = "run:started"
     run_id: str = ""
 
+    def __post_init__(self) -> None:
+        _intern_fields(self, "run_id")
+
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RunCompletedEvent:
     type: Literal["run:completed"] = "run:completed"
     run_id: str = ""
 
+    def __post_init__(self) -> None:
+        _intern_fields(self, "run_id")
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class RunFailedEvent:
     type: Literal["run:failed"] = "run:failed"
     run_id: str = ""
     error: str = ""
 
+    def __post_init__(self) -> None:
+        _intern_fields(self, "run_id")
+
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RunCancelledEvent:
     type: Literal["run:cancelled"] = "run:cancelled"
     run_id: str = ""
 
+    def __post_init__(self) -> None:
+        _intern_fields(self, "run_id")
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class StepStartedEvent:
     type: Literal["step:started"] = "step:started"
     run_id: str = ""
     step_name: str = ""
 
+    def __post_init__(self) -> None:
+        _intern_fields(self, "run_id", "step_name")
+
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StepCompletedEvent:
     type: Literal["step:completed"] = "step:completed"
     run_id: str = ""
@@ -507,8 +607,11 @@ class StepCompletedEvent:
     exit_code: int | None = None
     exit_signal: str | None = None
 
+    def __post_init__(self) -> None:
+        _intern_fields(self, "run_id", "step_name")
+
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StepFailedEvent:
     type: Literal["step:failed"] = "step:failed"
     run_id: str = ""
@@ -517,36 +620,51 @@ class StepFailedEvent:
     exit_code: int | None = None
     exit_signal: str | None = None
 
+    def __post_init__(self) -> None:
+        _intern_fields(self, "run_id", "step_name")
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class StepSkippedEvent:
     type: Literal["step:skipped"] = "step:skipped"
     run_id: str = ""
     step_name: str = ""
 
+    def __post_init__(self) -> None:
+        _intern_fields(self, "run_id", "step_name")
+
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StepRetryingEvent:
     type: Literal["step:retrying"] = "step:retrying"
     run_id: str = ""
     step_name: str = ""
     attempt: int | None = None
 
+    def __post_init__(self) -> None:
+        _intern_fields(self, "run_id", "step_name")
+
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StepNudgedEvent:
     type: Literal["step:nudged"] = "step:nudged"
     run_id: str = ""
     step_name: str = ""
     nudge_count: int | None = None
 
+    def __post_init__(self) -> None:
+        _intern_fields(self, "run_id", "step_name")
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class StepForceReleasedEvent:
     type: Literal["step:force-released"] = "step:force-released"
     run_id: str = ""
     step_name: str = ""
 
+    def __post_init__(self) -> None:
+        _intern_fields(self, "run_id", "step_name")
+
 
 WorkflowEvent: TypeAlias = (
     RunStartedEvent
@@ -565,7 +683,72 @@ WorkflowEvent: TypeAlias = (
 WorkflowEventCallback: TypeAlias = Callable[[WorkflowEvent], None]
 
 
-@dataclass
+def _noop_event_handler(event: WorkflowEvent) -> None:
+    pass
+
+
+def dispatch_event(
+    event: WorkflowEvent, handlers: dict[str, WorkflowEventCallback]
+) -> None:
+    """Dispatch ``event`` to the handler registered under its ``type`` tag."""
+    handlers.get(event.type, _noop_event_handler)(event)
+
+
+# One factory per event type, pulling the camelCase wire fields directly
+# rather than expanding the payload through **kwargs.
+_EVENT_FACTORIES: dict[str, Callable[[dict[str, Any]], "WorkflowEvent"]] = {
+    "run:started": lambda p: RunStartedEvent(run_id=p.get("runId", "")),
+    "run:completed": lambda p: RunCompletedEvent(run_id=p.get("runId", "")),
+    "run:failed": lambda p: RunFailedEvent(
+        run_id=p.get("runId", ""), error=p.get("error", "")
+    ),
+    "run:cancelled": lambda p: RunCancelledEvent(run_id=p.get("runId", "")),
+    "step:started": lambda p: StepStartedEvent(
+        run_id=p.get("runId", ""), step_name=p.get("stepName", "")
+    ),
+    "step:completed": lambda p: StepCompletedEvent(
+        run_id=p.get("runId", ""),
+        step_name=p.get("stepName", ""),
+        output=p.get("output"),
+        exit_code=p.get("exitCode"),
+        exit_signal=p.get("exitSignal"),
+    ),
+    "step:failed": lambda p: StepFailedEvent(
+        run_id=p.get("runId", ""),
+        step_name=p.get("stepName", ""),
+        error=p.get("error", ""),
+        exit_code=p.get("exitCode"),
+        exit_signal=p.get("exitSignal"),
+    ),
+    "step:skipped": lambda p: StepSkippedEvent(
+        run_id=p.get("runId", ""), step_name=p.get("stepName", "")
+    ),
+    "step:retrying": lambda p: StepRetryingEvent(
+        run_id=p.get("runId", ""),
+        step_name=p.get("stepName", ""),
+        attempt=p.get("attempt"),
+    ),
+    "step:nudged": lambda p: StepNudgedEvent(
+        run_id=p.get("runId", ""),
+        step_name=p.get("stepName", ""),
+        nudge_count=p.get("nudgeCount"),
+    ),
+    "step:force-released": lambda p: StepForceReleasedEvent(
+        run_id=p.get("runId", ""), step_name=p.get("stepName", "")
+    ),
+}
+
+
+def parse_event(payload: dict[str, Any]) -> WorkflowEvent:
+    """Build a :data:`WorkflowEvent` from a wire payload dict."""
+    event_type = payload.get("type")
+    factory = _EVENT_FACTORIES.get(event_type)
+    if factory is None:
+        raise ValueError(f"unknown workflow event type: {event_type!r}")
+    return factory(payload)
+
+
+@dataclass(slots=True)
 class RunOptions:
     """Options for running a workflow via the `agent-relay run` CLI command."""
 
@@ -577,7 +760,7 @@ class RunOptions:
     dry_run: bool | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class StepResult:
     """Result of a single workflow step."""
 
@@ -586,8 +769,11 @@ class StepResult:
     output: str | None = None
     error: str | None = None
 
+    def __post_init__(self) -> None:
+        _intern_fields(self, "name", "status")
+
 
-@dataclass
+@dataclass(slots=True)
 class WorkflowResult:
     """Result of a workflow execution."""
 
@@ -598,7 +784,7 @@ class WorkflowResult:
     events: list[WorkflowEvent] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class WorkflowRunRow:
     id: str
     workspace_id: str
@@ -613,8 +799,11 @@ class WorkflowRunRow:
     created_at: str = ""
     updated_at: str = ""
 
+    def __post_init__(self) -> None:
+        _intern_fields(self, "workflow_name", "pattern", "status")
 
-@dataclass
+
+@dataclass(slots=True)
 class WorkflowStepRow:
     id: str
     run_id: str
@@ -630,3 +819,74 @@ class WorkflowStepRow:
     completed_at: str | None = None
     created_at: str = ""
     updated_at: str = ""
+
+    def __post_init__(self) -> None:
+        _intern_fields(self, "step_name", "agent_name", "status")
+
+
+@dataclass(slots=True)
+class WorkflowStepTable:
+    """Columnar view over :class:`WorkflowStepRow` records.
+
+    Bulk queries over a large run (e.g. counting failed steps) only need to
+    walk the column they filter on, instead of touching every field of every
+    row. ``retry_counts`` is an ``array('i')`` so the ints stay unboxed.
+    """
+
+    ids: list[str]
+    run_ids: list[str]
+    step_names: list[str]
+    agent_names: list[str]
+    statuses: list[str]
+    tasks: list[str]
+    depends_on: list[list[str]]
+    retry_counts: array
+    outputs: list[str | None]
+    errors: list[str | None]
+    started_ats: list[str | None]
+    completed_ats: list[str | None]
+    created_ats: list[str]
+    updated_ats: list[str]
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    @classmethod
+    def from_rows(cls, rows: Sequence[WorkflowStepRow]) -> WorkflowStepTable:
+        return cls(
+            ids=[row.id for row in rows],
+            run_ids=[row.run_id for row in rows],
+            step_names=[row.step_name for row in rows],
+            agent_names=[row.agent_name for row in rows],
+            statuses=[row.status for row in rows],
+            tasks=[row.task for row in rows],
+            depends_on=[row.depends_on for row in rows],
+            retry_counts=array("i", (row.retry_count for row in rows)),
+            outputs=[row.output for row in rows],
+            errors=[row.error for row in rows],
+            started_ats=[row.started_at for row in rows],
+            completed_ats=[row.completed_at for row in rows],
+            created_ats=[row.created_at for row in rows],
+            updated_ats=[row.updated_at for row in rows],
+        )
+
+    def to_rows(self) -> list[WorkflowStepRow]:
+        return [
+            WorkflowStepRow(*fields)
+            for fields in zip(
+                self.ids,
+                self.run_ids,
+                self.step_names,
+                self.agent_names,
+                self.statuses,
+                self.tasks,
+                self.depends_on,
+                self.retry_counts,
+                self.outputs,
+                self.errors,
+                self.started_ats,
+                self.completed_ats,
+                self.created_ats,
+                self.updated_ats,
+            )
+        ]
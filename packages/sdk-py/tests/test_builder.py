@@ -1,7 +1,7 @@
 """Tests for the workflow builder."""
 
-import yaml
 import pytest
+
 from agent_relay import (
     PipelineStage,
     TemplateAgent,
@@ -21,8 +21,25 @@ from agent_relay.types import (
 )
 
 
-def test_basic_builder():
-    config = (
+def _load_yaml(yaml_str):
+    """Parse YAML with the libyaml C loader when available.
+
+    Imported lazily so collecting or running the non-YAML tests in this
+    module never pays the PyYAML import.
+    """
+    import yaml
+
+    try:
+        from yaml import CSafeLoader as loader
+    except ImportError:
+        from yaml import SafeLoader as loader
+    return yaml.load(yaml_str, Loader=loader)
+
+
+@pytest.fixture(scope="module")
+def basic_config():
+    """Build the minimal structural config once per module."""
+    return (
         workflow("test-workflow")
         .pattern("dag")
         .agent("worker", cli="claude", role="Test worker")
@@ -30,20 +47,11 @@ def test_basic_builder():
         .to_config()
     )
 
-    assert config["version"] == "1.0"
-    assert config["name"] == "test-workflow"
-    assert config["swarm"]["pattern"] == "dag"
-    assert len(config["agents"]) == 1
-    assert config["agents"][0]["name"] == "worker"
-    assert config["agents"][0]["cli"] == "claude"
-    assert config["agents"][0]["role"] == "Test worker"
-    assert len(config["workflows"]) == 1
-    assert config["workflows"][0]["name"] == "test-workflow-workflow"
-    assert len(config["workflows"][0]["steps"]) == 1
 
-
-def test_full_builder():
-    config = (
+@pytest.fixture(scope="module")
+def full_config():
+    """Build the fully-populated structural config once per module."""
+    return (
         workflow("migration")
         .description("Full migration workflow")
         .pattern("dag")
@@ -70,14 +78,37 @@ def test_full_builder():
         .to_config()
     )
 
+
+def test_basic_builder(basic_config):
+    config = basic_config
+
+    agents = config["agents"]
+    workflows = config["workflows"]
+
+    assert config["version"] == "1.0"
+    assert config["name"] == "test-workflow"
+    assert config["swarm"]["pattern"] == "dag"
+    assert len(agents) == 1
+    assert agents[0]["name"] == "worker"
+    assert agents[0]["cli"] == "claude"
+    assert agents[0]["role"] == "Test worker"
+    assert len(workflows) == 1
+    assert workflows[0]["name"] == "test-workflow-workflow"
+    assert len(workflows[0]["steps"]) == 1
+
+
+def test_full_builder(full_config):
+    config = full_config
+
     assert config["description"] == "Full migration workflow"
     assert config["swarm"]["maxConcurrency"] == 3
     assert config["swarm"]["timeoutMs"] == 5_400_000
     assert config["swarm"]["channel"] == "migration-channel"
 
-    assert len(config["agents"]) == 2
-    assert config["agents"][1]["cli"] == "codex"
-    assert config["agents"][1]["constraints"]["model"] == "gpt-4"
+    agents = config["agents"]
+    assert len(agents) == 2
+    assert agents[1]["cli"] == "codex"
+    assert agents[1]["constraints"]["model"] == "gpt-4"
 
     steps = config["workflows"][0]["steps"]
     assert steps[0]["verification"] == {"type": "output_contains", "value": "BUILD_DONE"}
@@ -89,16 +120,20 @@ def test_full_builder():
     assert config["errorHandling"]["maxRetries"] == 2
 
 
-def test_to_yaml_roundtrip():
+@pytest.fixture(scope="module")
+def roundtrip_parsed():
+    """Emit and parse the fixed roundtrip workflow once per module."""
     builder = (
         workflow("roundtrip")
         .pattern("fan-out")
         .agent("a", cli="claude")
         .step("s1", agent="a", task="Do something")
     )
+    return _load_yaml(builder.to_yaml())
 
-    yaml_str = builder.to_yaml()
-    parsed = yaml.safe_load(yaml_str)
+
+def test_to_yaml_roundtrip(roundtrip_parsed):
+    parsed = roundtrip_parsed
 
     assert parsed["version"] == "1.0"
     assert parsed["name"] == "roundtrip"
@@ -107,14 +142,111 @@ def test_to_yaml_roundtrip():
     assert parsed["workflows"][0]["steps"][0]["task"] == "Do something"
 
 
-def test_empty_agents_raises():
-    with pytest.raises(ValueError, match="at least one agent"):
-        workflow("empty").pattern("dag").step("s", agent="a", task="x").to_config()
+@pytest.mark.parametrize(
+    ("factory", "match"),
+    [
+        pytest.param(
+            lambda: workflow("empty").pattern("dag").step("s", agent="a", task="x").to_config(),
+            "at least one agent",
+            id="empty-agents",
+        ),
+        pytest.param(
+            lambda: workflow("empty").pattern("dag").agent("a", cli="claude").to_config(),
+            "at least one step",
+            id="empty-steps",
+        ),
+        pytest.param(
+            lambda: fan_out("empty", tasks=[]),
+            "at least one task",
+            id="fan-out-empty-tasks",
+        ),
+        pytest.param(
+            lambda: pipeline("empty", stages=[]),
+            "at least one stage",
+            id="pipeline-empty-stages",
+        ),
+        pytest.param(
+            lambda: dag("empty", agents=[], steps=[TemplateStep(name="s", agent="a", task="t")]),
+            "at least one agent",
+            id="dag-empty-agents",
+        ),
+        pytest.param(
+            lambda: dag("empty", agents=[TemplateAgent(name="a")], steps=[]),
+            "at least one step",
+            id="dag-empty-steps",
+        ),
+    ],
+)
+def test_empty_inputs_raise(factory, match):
+    with pytest.raises(ValueError, match=match):
+        factory()
 
 
-def test_empty_steps_raises():
-    with pytest.raises(ValueError, match="at least one step"):
-        workflow("empty").pattern("dag").agent("a", cli="claude").to_config()
+def test_step_references_missing_agent_raises():
+    builder = (
+        workflow("bad-ref")
+        .pattern("dag")
+        .agent("worker", cli="claude")
+        .step("s", agent="ghost", task="Do work")
+    )
+
+    with pytest.raises(ValueError, match="undeclared agent 'ghost'"):
+        builder.to_config()
+
+
+def test_valid_declaration_order_is_preserved():
+    config = (
+        workflow("stable")
+        .pattern("dag")
+        .agent("worker", cli="claude")
+        .step("s1", agent="worker", task="One")
+        .step("s2", agent="worker", task="Two", depends_on=["s1"])
+        .step("s3", agent="worker", task="Three")
+        .to_config()
+    )
+
+    steps = config["workflows"][0]["steps"]
+    assert [step["name"] for step in steps] == ["s1", "s2", "s3"]
+
+
+def test_forward_reference_is_reordered():
+    config = (
+        workflow("forward")
+        .pattern("dag")
+        .agent("worker", cli="claude")
+        .step("late", agent="worker", task="Late", depends_on=["early"])
+        .step("early", agent="worker", task="Early")
+        .to_config()
+    )
+
+    steps = config["workflows"][0]["steps"]
+    assert [step["name"] for step in steps] == ["early", "late"]
+
+
+def test_duplicate_step_name_raises():
+    builder = (
+        workflow("dupes")
+        .pattern("dag")
+        .agent("worker", cli="claude")
+        .step("dup", agent="worker", task="first")
+        .step("dup", agent="worker", task="second")
+    )
+
+    with pytest.raises(ValueError, match="Duplicate step name 'dup'"):
+        builder.to_config()
+
+
+def test_dependency_cycle_detection():
+    builder = (
+        workflow("cyclic")
+        .pattern("dag")
+        .agent("worker", cli="claude")
+        .step("a", agent="worker", task="A", depends_on=["b"])
+        .step("b", agent="worker", task="B", depends_on=["a"])
+    )
+
+    with pytest.raises(ValueError, match="dependency cycle"):
+        builder.to_config()
 
 
 def test_builder_extended_schema_options():
@@ -152,9 +284,10 @@ def test_templates_fan_out_pipeline_and_dag():
         tasks=["Task A", "Task B"],
         synthesis_task="Merge outputs",
     ).to_config()
+    fan_out_steps = fan_out_config["workflows"][0]["steps"]
     assert fan_out_config["swarm"]["pattern"] == "fan-out"
-    assert len(fan_out_config["workflows"][0]["steps"]) == 3
-    assert fan_out_config["workflows"][0]["steps"][-1]["dependsOn"] == ["task-1", "task-2"]
+    assert len(fan_out_steps) == 3
+    assert fan_out_steps[-1]["dependsOn"] == ["task-1", "task-2"]
 
     pipeline_config = pipeline(
         "pipe",
@@ -195,26 +328,6 @@ def test_parse_cli_event_types():
     assert event.error == "timeout"
 
 
-def test_fan_out_empty_tasks_raises():
-    with pytest.raises(ValueError, match="at least one task"):
-        fan_out("empty", tasks=[])
-
-
-def test_pipeline_empty_stages_raises():
-    with pytest.raises(ValueError, match="at least one stage"):
-        pipeline("empty", stages=[])
-
-
-def test_dag_empty_agents_raises():
-    with pytest.raises(ValueError, match="at least one agent"):
-        dag("empty", agents=[], steps=[TemplateStep(name="s", agent="a", task="t")])
-
-
-def test_dag_empty_steps_raises():
-    with pytest.raises(ValueError, match="at least one step"):
-        dag("empty", agents=[TemplateAgent(name="a")], steps=[])
-
-
 def test_run_options_dry_run_flag():
     """dry_run option should be passed through to CLI as --dry-run."""
     from agent_relay.types import RunOptions
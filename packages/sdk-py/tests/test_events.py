@@ -0,0 +1,136 @@
+"""Tests for workflow event parsing, dispatch, and the columnar step table."""
+
+import pytest
+
+from agent_relay import dispatch_event, parse_event, WorkflowStepTable
+from agent_relay.types import (
+    RunCancelledEvent,
+    RunCompletedEvent,
+    RunFailedEvent,
+    RunStartedEvent,
+    StepCompletedEvent,
+    StepFailedEvent,
+    StepForceReleasedEvent,
+    StepNudgedEvent,
+    StepRetryingEvent,
+    StepSkippedEvent,
+    StepStartedEvent,
+    WorkflowStepRow,
+)
+
+
+@pytest.mark.parametrize(
+    ("payload", "expected_type"),
+    [
+        ({"type": "run:started", "runId": "r1"}, RunStartedEvent),
+        ({"type": "run:completed", "runId": "r1"}, RunCompletedEvent),
+        ({"type": "run:failed", "runId": "r1", "error": "boom"}, RunFailedEvent),
+        ({"type": "run:cancelled", "runId": "r1"}, RunCancelledEvent),
+        ({"type": "step:started", "runId": "r1", "stepName": "s"}, StepStartedEvent),
+        ({"type": "step:completed", "runId": "r1", "stepName": "s"}, StepCompletedEvent),
+        ({"type": "step:failed", "runId": "r1", "stepName": "s", "error": "x"}, StepFailedEvent),
+        ({"type": "step:skipped", "runId": "r1", "stepName": "s"}, StepSkippedEvent),
+        ({"type": "step:retrying", "runId": "r1", "stepName": "s", "attempt": 2}, StepRetryingEvent),
+        ({"type": "step:nudged", "runId": "r1", "stepName": "s", "nudgeCount": 1}, StepNudgedEvent),
+        ({"type": "step:force-released", "runId": "r1", "stepName": "s"}, StepForceReleasedEvent),
+    ],
+)
+def test_parse_event_types(payload, expected_type):
+    event = parse_event(payload)
+    assert isinstance(event, expected_type)
+    assert event.run_id == "r1"
+
+
+def test_parse_event_wire_fields():
+    event = parse_event(
+        {
+            "type": "step:failed",
+            "runId": "r1",
+            "stepName": "build",
+            "error": "timeout",
+            "exitCode": 1,
+            "exitSignal": "SIGTERM",
+        }
+    )
+    assert isinstance(event, StepFailedEvent)
+    assert event.step_name == "build"
+    assert event.error == "timeout"
+    assert event.exit_code == 1
+    assert event.exit_signal == "SIGTERM"
+
+
+def test_parse_event_unknown_type_raises():
+    with pytest.raises(ValueError, match="unknown workflow event type: 'run:exploded'"):
+        parse_event({"type": "run:exploded"})
+
+
+def test_parse_event_missing_type_raises():
+    with pytest.raises(ValueError, match="unknown workflow event type: None"):
+        parse_event({"runId": "r1"})
+
+
+def test_dispatch_event_routes_to_registered_handler():
+    seen = []
+    handlers = {
+        "run:completed": seen.append,
+        "step:failed": lambda event: seen.append(("failed", event)),
+    }
+
+    completed = RunCompletedEvent(run_id="r1")
+    dispatch_event(completed, handlers)
+    assert seen == [completed]
+
+    failed = StepFailedEvent(run_id="r1", step_name="build", error="boom")
+    dispatch_event(failed, handlers)
+    assert seen[-1] == ("failed", failed)
+
+
+def test_dispatch_event_unregistered_type_is_noop():
+    seen = []
+    dispatch_event(RunStartedEvent(run_id="r1"), {"run:completed": seen.append})
+    assert seen == []
+
+    # An empty handler table is fine too.
+    dispatch_event(RunStartedEvent(run_id="r1"), {})
+
+
+def test_workflow_step_table_roundtrip():
+    rows = [
+        WorkflowStepRow(
+            id="st-1",
+            run_id="r1",
+            step_name="build",
+            agent_name="backend",
+            status="completed",
+            task="Build the API",
+            depends_on=[],
+            retry_count=0,
+            output="ok",
+            error=None,
+        ),
+        WorkflowStepRow(
+            id="st-2",
+            run_id="r1",
+            step_name="test",
+            agent_name="tester",
+            status="failed",
+            task="Run tests",
+            depends_on=["build"],
+            retry_count=2,
+            output=None,
+            error="timeout",
+        ),
+    ]
+
+    table = WorkflowStepTable.from_rows(rows)
+    assert len(table) == 2
+    assert list(table.retry_counts) == [0, 2]
+    assert table.outputs == ["ok", None]
+    assert table.errors == [None, "timeout"]
+    assert table.to_rows() == rows
+
+
+def test_workflow_step_table_empty():
+    table = WorkflowStepTable.from_rows([])
+    assert len(table) == 0
+    assert table.to_rows() == []